@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import asyncio
 import logging
 from typing import Any
-from zoneinfo import ZoneInfo
 
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+)
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.storage import Store
 
 from .api import WwzApiClient, WwzApiError, WwzAuthError
 from .const import (
@@ -27,66 +30,99 @@ from .const import (
     DEFAULT_GRID_TARIFF,
     DEFAULT_LOOKBACK_DAYS,
     DOMAIN,
+    SESSION_STORAGE_VERSION,
 )
-from .coordinator import WwzEnergyCoordinator
-from .tariff import TariffData, fetch_tariff_data
+from .coordinator import WwzEnergyCoordinator, WwzTariffCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-TARIFF_UPDATE_INTERVAL = timedelta(hours=24)
+_CONNECTOR = "_connector"
+_CONNECTOR_USERS = "_connector_users"
+_CONNECTOR_CLOSE_UNSUB = "_connector_close_unsub"
+
+
+def _session_store(hass: HomeAssistant, entry: ConfigEntry) -> Store[dict[str, Any]]:
+    """Return the store holding the persisted portal session for an entry."""
+    return Store(hass, SESSION_STORAGE_VERSION, f"{DOMAIN}.session.{entry.entry_id}")
 
 
-class WwzTariffCoordinator(DataUpdateCoordinator[dict[int, TariffData]]):
-    """Coordinator that caches WWZ tariff data per year."""
+def _shared_connector(hass: HomeAssistant) -> aiohttp.TCPConnector:
+    """Return the connector pooling portal connections across config entries.
+
+    Each client keeps its own cookie jar, so HA's shared client session cannot
+    be used; sharing the connector still reuses TLS connections and DNS lookups.
+    Every call must be paired with _async_release_connector.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    connector = domain_data.get(_CONNECTOR)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=10, ttl_dns_cache=300, keepalive_timeout=75
+        )
+        domain_data[_CONNECTOR] = connector
+        domain_data[_CONNECTOR_USERS] = 0
+
+        async def _async_close_connector(_event: Event) -> None:
+            if domain_data.get(_CONNECTOR) is connector:
+                domain_data.pop(_CONNECTOR_CLOSE_UNSUB, None)
+            await connector.close()
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        super().__init__(
-            hass,
-            _LOGGER,
-            name="WWZ Tariff",
-            update_interval=TARIFF_UPDATE_INTERVAL,
+        domain_data[_CONNECTOR_CLOSE_UNSUB] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, _async_close_connector
         )
-        self._cached: dict[int, TariffData] = {}
-
-    async def _async_update_data(self) -> dict[int, TariffData]:
-        current_year = datetime.now(tz=ZoneInfo("Europe/Zurich")).year
-        years_needed = [current_year - 1, current_year]
-
-        async with aiohttp.ClientSession() as session:
-            for year in years_needed:
-                if year in self._cached:
-                    continue
-                try:
-                    self._cached[year] = await fetch_tariff_data(session, year)
-                except aiohttp.ClientResponseError as err:
-                    if err.status == 404:
-                        _LOGGER.debug("Tariff %d not available", year)
-                    else:
-                        raise UpdateFailed(
-                            f"Failed to fetch tariff data: {err}"
-                        ) from err
-                except aiohttp.ClientError as err:
-                    raise UpdateFailed(
-                        f"Connection error fetching tariffs: {err}"
-                    ) from err
-
-        return {y: t for y, t in self._cached.items() if y in years_needed}
+
+    domain_data[_CONNECTOR_USERS] += 1
+    return connector
+
+
+async def _async_release_connector(hass: HomeAssistant) -> None:
+    """Drop one user of the shared connector, closing it after the last."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if _CONNECTOR not in domain_data:
+        return
+    domain_data[_CONNECTOR_USERS] -= 1
+    if domain_data[_CONNECTOR_USERS] > 0:
+        return
+
+    unsub = domain_data.pop(_CONNECTOR_CLOSE_UNSUB, None)
+    if unsub is not None:
+        unsub()
+    domain_data.pop(_CONNECTOR_USERS)
+    await domain_data.pop(_CONNECTOR).close()
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up WWZ Energy from a config entry."""
-    client = WwzApiClient(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
-    try:
-        await client.login()
-    except WwzAuthError as err:
-        await client.close()
-        raise ConfigEntryAuthFailed(str(err)) from err
-    except WwzApiError as err:
-        await client.close()
-        raise ConfigEntryNotReady(f"WWZ portal unavailable: {err}") from err
-    except Exception:
+    store = _session_store(hass, entry)
+    session_state = await store.async_load()
+    if session_state and session_state.get("meter_id") != entry.unique_id:
+        session_state = None
+
+    client = WwzApiClient(
+        entry.data[CONF_USERNAME],
+        entry.data[CONF_PASSWORD],
+        session_state,
+        connector=_shared_connector(hass),
+    )
+
+    async def _async_abort_setup() -> None:
         await client.close()
-        raise
+        await _async_release_connector(hass)
+
+    if session_state:
+        _LOGGER.debug("Reusing persisted portal session, skipping login")
+    else:
+        try:
+            await client.login()
+        except WwzAuthError as err:
+            await _async_abort_setup()
+            raise ConfigEntryAuthFailed(str(err)) from err
+        except WwzApiError as err:
+            await _async_abort_setup()
+            raise ConfigEntryNotReady(f"WWZ portal unavailable: {err}") from err
+        except Exception:
+            await _async_abort_setup()
+            raise
 
     lookback_days = entry.options.get(CONF_LOOKBACK_DAYS, DEFAULT_LOOKBACK_DAYS)
     full_days_only = entry.options.get(CONF_FULL_DAYS_ONLY, False)
@@ -95,22 +131,53 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass, client, entry.unique_id, lookback_days, full_days_only
     )
 
+    saved_state = session_state
+    pending_saves: set[asyncio.Task[None]] = set()
+
+    @callback
+    def _async_save_session() -> None:
+        # Runs after every refresh; persist cookies and IDs (including any
+        # obtained by a re-login) so the next startup can skip the login flow.
+        # Most refreshes leave the session untouched, so only write on change.
+        # Writes are tracked so unload can wait for them to reach disk.
+        nonlocal saved_state
+        if not energy_coordinator.last_update_success:
+            return
+        state = client.export_state()
+        if state == saved_state:
+            return
+        saved_state = state
+        task = hass.async_create_task(store.async_save(state))
+        pending_saves.add(task)
+        task.add_done_callback(pending_saves.discard)
+
+    entry.async_on_unload(energy_coordinator.async_add_listener(_async_save_session))
+
     entry_data: dict[str, Any] = {
         "energy_coordinator": energy_coordinator,
         "tariff_coordinator": None,
+        "session_saves": pending_saves,
     }
 
     if entry.options.get(CONF_ENABLE_PRICE_SENSOR, False):
         tariff_coordinator = WwzTariffCoordinator(hass)
-        await tariff_coordinator.async_config_entry_first_refresh()
+        try:
+            await tariff_coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await _async_abort_setup()
+            raise
         entry_data["tariff_coordinator"] = tariff_coordinator
 
-        tariff_by_year = tariff_coordinator.data
-        if tariff_by_year:
-            energy_tariff = entry.options.get(CONF_ENERGY_TARIFF, DEFAULT_ENERGY_TARIFF)
-            grid_tariff = entry.options.get(CONF_GRID_TARIFF, DEFAULT_GRID_TARIFF)
-            municipality = entry.options.get(CONF_MUNICIPALITY, "")
-            for year, td in tariff_by_year.items():
+        energy_tariff = entry.options.get(CONF_ENERGY_TARIFF, DEFAULT_ENERGY_TARIFF)
+        grid_tariff = entry.options.get(CONF_GRID_TARIFF, DEFAULT_GRID_TARIFF)
+        municipality = entry.options.get(CONF_MUNICIPALITY, "")
+
+        @callback
+        def _async_update_prices() -> None:
+            # Precompute the total price per year whenever tariff data is
+            # refreshed, so new-year tariffs reach the energy coordinator
+            # without a reload and each statistic only needs a dict lookup.
+            for year, td in (tariff_coordinator.data or {}).items():
                 price = td.calculate_total_price(energy_tariff, grid_tariff, municipality)
                 if price:
                     energy_coordinator.price_per_kwh_by_year[year] = price
@@ -119,13 +186,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 energy_coordinator.price_per_kwh_by_year,
             )
 
+        _async_update_prices()
+        # Registering a listener also starts the tariff coordinator's
+        # refresh loop, which does not run without one.
+        entry.async_on_unload(tariff_coordinator.async_add_listener(_async_update_prices))
+
     try:
         await energy_coordinator.async_config_entry_first_refresh()
     except Exception:
-        await client.close()
+        await _async_abort_setup()
         raise
 
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = entry_data
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
@@ -140,9 +211,15 @@ async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> Non
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    data = hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+    domain_data = hass.data.get(DOMAIN, {})
+    data = domain_data.pop(entry.entry_id, None)
     if data:
+        # Finish pending session writes, so a reload reads the current state
+        # and a later removal of the store is not undone by a late write.
+        if data["session_saves"]:
+            await asyncio.gather(*data["session_saves"])
         await data["energy_coordinator"].api_client.close()
+        await _async_release_connector(hass)
     return True
 
 
@@ -154,3 +231,5 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 
     statistic_ids = list(statistic_ids_for_entry(entry.unique_id or ""))
     get_instance(hass).async_clear_statistics(statistic_ids)
+
+    await _session_store(hass, entry).async_remove()
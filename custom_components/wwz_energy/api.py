@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from http.cookies import Morsel
+from typing import Any
 
 import aiohttp
+import orjson
+from yarl import URL
 
 from .const import (
     API_BASE_URL,
@@ -16,6 +19,7 @@ from .const import (
     API_METER_POINT_ID_PATH,
     API_METER_POINTS_PATH,
     API_VALIDATION_PATH,
+    CET,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,6 +36,22 @@ _COMMON_HEADERS = {
 }
 
 
+def _json_dumps(obj: Any) -> str:
+    """Serialise request bodies with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
+
+def _start_of_day_ms(date: datetime) -> int:
+    """Return the Europe/Zurich midnight of date as epoch milliseconds.
+
+    The midnight is built directly rather than shifted by the current UTC
+    offset, which would be an hour off on DST change days.
+    """
+    local = date if date.tzinfo is CET else date.astimezone(CET)
+    midnight = datetime(local.year, local.month, local.day, tzinfo=CET)
+    return int(midnight.timestamp()) * 1000
+
+
 class WwzApiError(Exception):
     """Base exception for WWZ API errors."""
 
@@ -47,25 +67,58 @@ class WwzApiClient:
     server must be "warmed up" by calling contractAccounts, getMeterPoints, and
     getMeterPointId — these set up server-side context that authorises the
     getDiagramValues endpoint.
+
+    A previously exported session state (see export_state) can be passed in to
+    reuse the cookies and discovered IDs without logging in again.  If the
+    server has expired the session, the first request fails and the normal
+    re-authentication path runs the full login flow.
+
+    An externally owned connector may be supplied so that several clients
+    share one connection pool; it is left open when the client is closed.
     """
 
-    def __init__(self, username: str, password: str) -> None:
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session_state: dict[str, Any] | None = None,
+        connector: aiohttp.BaseConnector | None = None,
+    ) -> None:
         self._username = username
         self._password = password
+        self._connector = connector
         self._session: aiohttp.ClientSession | None = None
         self._token: dict | None = None
         self._contract_account_id: str | None = None
         self._meter_number: str | None = None
         self._meter_id: str | None = None
+        self._restored_cookies: list[dict[str, str]] = []
+
+        if session_state:
+            self._token = session_state.get("token")
+            self._contract_account_id = session_state.get("contract_account_id")
+            self._meter_number = session_state.get("meter_number")
+            self._meter_id = session_state.get("meter_id")
+            self._restored_cookies = session_state.get("cookies", [])
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
             jar = aiohttp.CookieJar(unsafe=True)
+            for cookie in self._restored_cookies:
+                morsel: Morsel[str] = Morsel()
+                morsel.set(cookie["name"], cookie["value"], cookie["coded_value"])
+                morsel["domain"] = cookie["domain"]
+                morsel["path"] = cookie["path"]
+                jar.update_cookies({cookie["name"]: morsel}, URL(API_BASE_URL))
+            self._restored_cookies = []
             timeout = aiohttp.ClientTimeout(total=30)
             self._session = aiohttp.ClientSession(
                 headers=_COMMON_HEADERS,
                 cookie_jar=jar,
                 timeout=timeout,
+                connector=self._connector,
+                connector_owner=self._connector is None,
+                json_serialize=_json_dumps,
             )
         return self._session
 
@@ -93,7 +146,7 @@ class WwzApiClient:
                 if resp.status != 200:
                     raise WwzAuthError(f"Login failed with status {resp.status}")
 
-                body = await resp.json()
+                body = await resp.json(loads=orjson.loads)
                 msg = body.get("frontEndMessage", {})
                 if msg.get("messageType") != 0:
                     raise WwzAuthError(
@@ -105,7 +158,16 @@ class WwzApiClient:
         except aiohttp.ClientError as err:
             raise WwzApiError(f"Connection error during login: {err}") from err
 
-        # Step 3: Validation (confirms session is authenticated)
+        # Steps 3+4: Validation, then warm up session context for smart
+        # meter access.  Kept strictly in order: the portal's server-side
+        # warmup state is what authorises getDiagramValues.
+        await self._call_validation(session)
+        await self._call_contract_accounts(session)
+        await self._call_meter_points(session)
+        await self._call_meter_point_id(session)
+
+    async def _call_validation(self, session: aiohttp.ClientSession) -> None:
+        """Call validation (confirms session is authenticated)."""
         try:
             async with session.post(
                 f"{API_BASE_URL}{API_VALIDATION_PATH}",
@@ -115,21 +177,18 @@ class WwzApiClient:
         except aiohttp.ClientError as err:
             raise WwzApiError(f"Validation failed: {err}") from err
 
-        # Step 4: Warm up session context for smart meter access
-        await self._setup_meter_context(session)
-
-    async def _setup_meter_context(self, session: aiohttp.ClientSession) -> None:
-        """Call contractAccounts → getMeterPoints → getMeterPointId.
+    async def _call_contract_accounts(self, session: aiohttp.ClientSession) -> None:
+        """Call contractAccounts → caId.
 
-        These calls set up server-side state required for getDiagramValues.
+        This and the meter point calls set up server-side state required for
+        getDiagramValues.
         """
-        # contractAccounts → get caId
         try:
             async with session.post(
                 f"{API_BASE_URL}{API_CONTRACT_ACCOUNTS_PATH}",
                 json={"token": self._token, "client": "wwz"},
             ) as resp:
-                body = await resp.json()
+                body = await resp.json(loads=orjson.loads)
                 accounts = body.get("data", [])
                 if not accounts:
                     raise WwzApiError("No contract accounts found")
@@ -138,13 +197,14 @@ class WwzApiClient:
         except aiohttp.ClientError as err:
             raise WwzApiError(f"Failed to get contract accounts: {err}") from err
 
-        # getMeterPoints → get meterPointNumber
+    async def _call_meter_points(self, session: aiohttp.ClientSession) -> None:
+        """Call getMeterPoints → meterPointNumber."""
         try:
             async with session.get(
                 f"{API_BASE_URL}{API_METER_POINTS_PATH}",
                 params={"contractAccount": self._contract_account_id},
             ) as resp:
-                body = await resp.json()
+                body = await resp.json(loads=orjson.loads)
                 contracts = (body.get("data") or {}).get("contracts", [])
                 if not contracts:
                     raise WwzApiError("No meter points found")
@@ -153,13 +213,14 @@ class WwzApiClient:
         except aiohttp.ClientError as err:
             raise WwzApiError(f"Failed to get meter points: {err}") from err
 
-        # getMeterPointId → get numeric meter ID
+    async def _call_meter_point_id(self, session: aiohttp.ClientSession) -> None:
+        """Call getMeterPointId → numeric meter ID."""
         try:
             async with session.get(
                 f"{API_BASE_URL}{API_METER_POINT_ID_PATH}",
                 params={"meterNumber": self._meter_number},
             ) as resp:
-                body = await resp.json()
+                body = await resp.json(loads=orjson.loads)
                 data = body.get("data") or {}
                 self._meter_id = str(data.get("meterId", ""))
                 if not self._meter_id:
@@ -173,6 +234,30 @@ class WwzApiClient:
         """Return the discovered meter ID."""
         return self._meter_id
 
+    def export_state(self) -> dict[str, Any]:
+        """Return the session cookies and discovered IDs as a JSON-serialisable dict."""
+        cookies = (
+            [
+                {
+                    "name": m.key,
+                    "value": m.value,
+                    "coded_value": m.coded_value,
+                    "domain": m["domain"],
+                    "path": m["path"],
+                }
+                for m in self._session.cookie_jar
+            ]
+            if self._session is not None
+            else self._restored_cookies
+        )
+        return {
+            "cookies": cookies,
+            "token": self._token,
+            "contract_account_id": self._contract_account_id,
+            "meter_number": self._meter_number,
+            "meter_id": self._meter_id,
+        }
+
     async def get_hourly_data(
         self,
         meter_id: str,
@@ -181,6 +266,9 @@ class WwzApiClient:
     ) -> dict:
         """Fetch hourly energy data for a date range.
 
+        The whole range is requested with a single getDiagramValues call, so
+        a multi-day backfill costs one round-trip regardless of its length.
+
         Args:
             meter_id: The smart meter ID.
             from_date: Start date (defaults to today).
@@ -188,20 +276,13 @@ class WwzApiClient:
 
         Returns dict with "values" and "unit".
         """
-        cet = ZoneInfo("Europe/Zurich")
         if from_date is None:
-            from_date = datetime.now(tz=cet)
+            from_date = datetime.now(tz=CET)
         if to_date is None:
             to_date = from_date
 
-        from_midnight = from_date.astimezone(cet).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        to_midnight = to_date.astimezone(cet).replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        from_ms = int(from_midnight.timestamp() * 1000)
-        to_ms = int(to_midnight.timestamp() * 1000)
+        from_ms = _start_of_day_ms(from_date)
+        to_ms = _start_of_day_ms(to_date)
 
         url = f"{API_BASE_URL}{API_DATA_PATH}"
         params = {
@@ -235,7 +316,10 @@ class WwzApiClient:
                             f"API request failed ({resp.status}): {body_preview}"
                         )
                         continue
-                    data = await resp.json(content_type=None)
+                    # Parse the raw body directly; the data endpoint is the
+                    # large one and needs no content-type or charset handling.
+                    # orjson.JSONDecodeError is a ValueError.
+                    data = orjson.loads(await resp.read())
             except (aiohttp.ClientError, ValueError) as err:
                 last_err = WwzApiError(f"Request error: {err}")
                 continue
@@ -19,6 +19,7 @@ from homeassistant.helpers.selector import (
 
 from .api import WwzApiClient, WwzApiError, WwzAuthError
 from .const import (
+    CET,
     CONF_ENABLE_PRICE_SENSOR,
     CONF_ENERGY_TARIFF,
     CONF_FULL_DAYS_ONLY,
@@ -51,9 +52,8 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 async def _fetch_tariff_or_none() -> TariffData | None:
     """Fetch current-year tariff data, returning None on failure."""
     from datetime import datetime
-    from zoneinfo import ZoneInfo
 
-    year = datetime.now(tz=ZoneInfo("Europe/Zurich")).year
+    year = datetime.now(tz=CET).year
     async with aiohttp.ClientSession() as session:
         try:
             return await fetch_tariff_data(session, year)
@@ -1,7 +1,13 @@
 """Constants for the WWZ Energy integration."""
 
+from zoneinfo import ZoneInfo
+
 DOMAIN = "wwz_energy"
 
+CET = ZoneInfo("Europe/Zurich")
+
+SESSION_STORAGE_VERSION = 1
+
 API_BASE_URL = "https://cpp01.wwz.ch"
 API_LOGIN_PATH = "//loginRegistration/rest/loginService/login"
 API_VALIDATION_PATH = "//loginRegistration/rest/loginService/validation"
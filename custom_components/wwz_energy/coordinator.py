@@ -1,11 +1,17 @@
-"""DataUpdateCoordinator for WWZ Energy."""
+"""DataUpdateCoordinators for WWZ Energy."""
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, time, timedelta
+from itertools import accumulate
 import logging
-from zoneinfo import ZoneInfo
+from operator import itemgetter
+from typing import NamedTuple
+
+import aiohttp
 
 from homeassistant.components.recorder.models import StatisticData, StatisticMeanType, StatisticMetaData
 from homeassistant.components.recorder.statistics import (
@@ -19,15 +25,50 @@ from homeassistant.helpers.recorder import get_instance
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import WwzApiClient, WwzApiError
+from .const import CET, DOMAIN
+from .tariff import TariffData, fetch_tariff_data
 from .util import statistic_ids_for_entry
 
 _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(hours=1)
-CET = ZoneInfo("Europe/Zurich")
-
-
-class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
+# Back off to STALE_UPDATE_INTERVAL after this many polls without new hours;
+# the portal often publishes only once a day.
+STALE_UPDATE_INTERVAL = timedelta(hours=4)
+STALE_POLLS_BEFORE_BACKOFF = 2
+# Trailing hours of each insert kept in memory as base sums for the next
+# window, which starts a couple of hours before the last recorded statistic.
+SUM_CACHE_HOURS = 24
+TARIFF_UPDATE_INTERVAL = timedelta(hours=24)
+
+
+def _sum_metadata(
+    name: str, statistic_id: str, unit: str, unit_class: str | None
+) -> StatisticMetaData:
+    """Return metadata for an external sum-only statistic of this integration."""
+    return StatisticMetaData(
+        has_mean=False,
+        mean_type=StatisticMeanType.NONE,
+        has_sum=True,
+        name=name,
+        source=DOMAIN,
+        statistic_id=statistic_id,
+        unit_of_measurement=unit,
+        unit_class=unit_class,
+    )
+
+
+class WwzEnergyData(NamedTuple):
+    """Result of an energy coordinator refresh.
+
+    values holds the valid hourly values, deduplicated and ordered by date.
+    """
+
+    values: list[dict]
+    unit: str
+
+
+class WwzEnergyCoordinator(DataUpdateCoordinator[WwzEnergyData]):
     """Coordinator to fetch WWZ energy data."""
 
     def __init__(
@@ -49,7 +90,21 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
         self.lookback_days = lookback_days
         self.full_days_only = full_days_only
         self.energy_statistic_id, self.cost_statistic_id = statistic_ids_for_entry(entry_unique_id)
+        self._energy_metadata = _sum_metadata(
+            "WWZ Energy Consumption",
+            self.energy_statistic_id,
+            UnitOfEnergy.KILO_WATT_HOUR,
+            "energy",
+        )
+        self._cost_metadata = _sum_metadata(
+            "WWZ Energy Cost", self.cost_statistic_id, "CHF", None
+        )
         self.price_per_kwh_by_year: dict[int, float] = {}
+        self._last_stats_hash: int | None = None
+        self._latest_value_ts: int | None = None
+        self._stale_polls = 0
+        # statistic_id -> {hour start ts: running sum} from the last insert
+        self._sum_cache: dict[str, dict[float, float]] = {}
 
         @callback
         def _dummy_listener() -> None:
@@ -62,7 +117,7 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
         # _async_update_data is called on every update_interval.
         self.async_add_listener(_dummy_listener)
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> WwzEnergyData:
         """Fetch energy data and write external statistics for consumption and cost."""
         meter_id = self.api_client.meter_id
         if not meter_id:
@@ -76,15 +131,19 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
         except WwzApiError as err:
             raise UpdateFailed(f"Error fetching WWZ data: {err}") from err
 
+        values = data.get("values", [])
+
         # Filter valid values and deduplicate by timestamp (prefer status=0)
         seen: dict[int, dict] = {}
-        for v in data.get("values", []):
-            if v.get("status") == 0 or (v.get("status") == 3 and v.get("value", 0) > 0):
-                ts = v["date"]
-                if ts not in seen or v.get("status") == 0:
-                    seen[ts] = v
+        for v in values:
+            status = v.get("status")
+            if status == 0:
+                seen[v["date"]] = v
+            elif status == 3 and v.get("value", 0) > 0:
+                seen.setdefault(v["date"], v)
 
-        sorted_values = sorted(seen.values(), key=lambda x: x["date"])
+        sorted_values = sorted(seen.values(), key=itemgetter("date"))
+        self._adapt_update_interval(sorted_values[-1]["date"] if sorted_values else None)
 
         if self.full_days_only:
             sorted_values = self._filter_full_days(sorted_values)
@@ -92,24 +151,75 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
         _LOGGER.debug(
             "%d valid values out of %d total",
             len(sorted_values),
-            len(data.get("values", [])),
+            len(values),
         )
 
         if sorted_values:
             await self._insert_statistics(sorted_values, from_date)
 
-        return data
+        return WwzEnergyData(sorted_values, data.get("unit", "kWh"))
+
+    def _adapt_update_interval(self, latest_ts: int | None) -> None:
+        """Poll less often while the portal publishes no new hours.
+
+        Reassigning update_interval takes effect when the coordinator
+        schedules its next refresh.
+        """
+        if latest_ts is not None and (
+            self._latest_value_ts is None or latest_ts > self._latest_value_ts
+        ):
+            self._latest_value_ts = latest_ts
+            self._stale_polls = 0
+            if self.update_interval != UPDATE_INTERVAL:
+                _LOGGER.debug("New data available, polling every %s", UPDATE_INTERVAL)
+                self.update_interval = UPDATE_INTERVAL
+            return
+
+        self._stale_polls += 1
+        if (
+            self._stale_polls >= STALE_POLLS_BEFORE_BACKOFF
+            and self.update_interval != STALE_UPDATE_INTERVAL
+        ):
+            _LOGGER.debug(
+                "No new data for %d polls, polling every %s",
+                self._stale_polls,
+                STALE_UPDATE_INTERVAL,
+            )
+            self.update_interval = STALE_UPDATE_INTERVAL
 
     @staticmethod
     def _filter_full_days(sorted_values: list[dict]) -> list[dict]:
-        """Keep only values belonging to calendar days with 24 hourly entries."""
-        by_day: dict[str, list[dict]] = defaultdict(list)
+        """Keep only values belonging to calendar days with an entry for every hour.
+
+        Local days have 23 or 25 hours on DST change days, so the expected
+        count is taken from the day's UTC length rather than assumed to be 24.
+        Midnight is never ambiguous in Europe/Zurich (changes happen at 02:00
+        and 03:00), so the default fold=0 is always the right choice.
+        """
+        by_day: dict[date, list[dict]] = defaultdict(list)
+        hours_in_day: dict[date, int] = {}
+        # Values are time-ordered, so only convert a timestamp when it
+        # crosses into the next local day.
+        day = date.min
+        next_midnight_ms = 0
         for v in sorted_values:
-            day = datetime.fromtimestamp(v["date"] / 1000, tz=CET).strftime("%Y-%m-%d")
+            if v["date"] >= next_midnight_ms:
+                day = datetime.fromtimestamp(v["date"] / 1000, tz=CET).date()
+                midnight = datetime.combine(day, time.min, tzinfo=CET)
+                next_midnight = datetime.combine(
+                    day + timedelta(days=1), time.min, tzinfo=CET
+                )
+                next_midnight_ms = int(next_midnight.timestamp()) * 1000
+                hours_in_day[day] = (
+                    next_midnight_ms - int(midnight.timestamp()) * 1000
+                ) // 3_600_000
             by_day[day].append(v)
 
         return [
-            v for day, values in by_day.items() if len(values) == 24 for v in values
+            v
+            for day, values in by_day.items()
+            if len(values) == hours_in_day[day]
+            for v in values
         ]
 
     async def _get_fetch_start(self, now: datetime) -> datetime:
@@ -122,25 +232,41 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
         fallback = now - timedelta(days=self.lookback_days)
         try:
             last_stat = await get_instance(self.hass).async_add_executor_job(
-                get_last_statistics, self.hass, 1, self.energy_statistic_id, False, {"start"}
+                get_last_statistics,
+                self.hass,
+                1,
+                self.energy_statistic_id,
+                False,
+                {"start", "sum"},
             )
         except Exception:
             _LOGGER.debug("Could not query recorder for last statistic, using full lookback")
+            self._sum_cache.clear()
             return fallback
 
         if not last_stat or self.energy_statistic_id not in last_stat:
             _LOGGER.debug("No existing statistics found, using full lookback")
+            self._sum_cache.clear()
             return fallback
 
-        # start is a UTC epoch float (seconds) from the recorder DB
+        # start is a UTC epoch float (seconds) from the recorder DB.  Do the
+        # overlap arithmetic on epoch seconds: subtracting a timedelta from an
+        # aware datetime is wall-clock arithmetic and is off by an hour across
+        # a DST change.
         last_start = last_stat[self.energy_statistic_id][0]["start"]
+        last_sum = last_stat[self.energy_statistic_id][0].get("sum")
+        # The cached sums are only trusted while the recorder still ends where
+        # the previous insert left it; sums adjusted or imported since then
+        # must be read back from the recorder.
+        if self._sum_cache.get(self.energy_statistic_id, {}).get(last_start) != last_sum:
+            self._sum_cache.clear()
         last_dt = datetime.fromtimestamp(last_start, tz=CET)
-        fetch_from = last_dt - timedelta(hours=2)
+        fetch_from = datetime.fromtimestamp(last_start - 2 * 3600, tz=CET)
         _LOGGER.debug(
             "Last statistic at %s, fetching from %s (saved ~%d hours)",
             last_dt.isoformat(),
             fetch_from.isoformat(),
-            max(0, int((fetch_from - fallback).total_seconds() / 3600)),
+            max(0, int((fetch_from.timestamp() - fallback.timestamp()) / 3600)),
         )
         return fetch_from
 
@@ -149,8 +275,16 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
     ) -> tuple[float, float | None]:
         """Return (sum, last_start_ts) from the recorder at fetch_start.
 
-        Returns (0.0, None) when no prior statistics exist.
+        Served from the sums of the previous insert when it covered
+        fetch_start, so the recorder is only queried on the first run, after
+        a gap, or once its last sum no longer matches the cache.  Returns
+        (0.0, None) when no prior statistics exist.
         """
+        start_ts = fetch_start.timestamp()
+        cached = self._sum_cache.get(statistic_id, {}).get(start_ts)
+        if cached is not None:
+            return cached, start_ts
+
         try:
             stats = await get_instance(self.hass).async_add_executor_job(
                 statistics_during_period,
@@ -168,73 +302,131 @@ class WwzEnergyCoordinator(DataUpdateCoordinator[dict]):
         if not stats or statistic_id not in stats:
             return 0.0, None
 
-        return stats[statistic_id][0]["sum"], stats[statistic_id][0]["start"]
+        first = stats[statistic_id][0]
+        return first["sum"], first["start"]
 
     async def _insert_statistics(self, sorted_values: list[dict], fetch_start: datetime) -> None:
         """Write hourly energy consumption and cost as external statistics."""
-        energy_sum, last_energy_ts = await self._get_last_sum(
-            self.energy_statistic_id, fetch_start
+        prices = self.price_per_kwh_by_year
+
+        # The portal often serves the same values for several polls; skip
+        # the recorder round-trips when nothing (including prices) changed.
+        stats_hash = hash((
+            tuple((v["date"], v.get("value")) for v in sorted_values),
+            tuple(sorted(prices.items())),
+        ))
+        if stats_hash == self._last_stats_hash:
+            _LOGGER.debug("Values unchanged since last insert, skipping statistics")
+            return
+
+        (energy_sum, last_energy_ts), (cost_sum, _) = await asyncio.gather(
+            self._get_last_sum(self.energy_statistic_id, fetch_start),
+            self._get_last_sum(self.cost_statistic_id, fetch_start),
         )
-        cost_sum, last_cost_ts = await self._get_last_sum(
-            self.cost_statistic_id, fetch_start
-        )
-
-        energy_stats: list[StatisticData] = []
-        cost_stats: list[StatisticData] = []
 
-        for v in sorted_values:
-            kwh = v.get("value") or 0.0
-            dt = datetime.fromtimestamp(v["date"] / 1000, tz=CET).replace(
-                minute=0, second=0, microsecond=0
+        # Skip rows already covered by the recorder: a value's hour is at or
+        # before the last recorded hour exactly when its timestamp is before
+        # the end of that hour.
+        first = 0
+        if last_energy_ts is not None:
+            covered_until_ms = (int(last_energy_ts) // 3600 * 3600 + 3600) * 1000
+            first = bisect_left(sorted_values, covered_until_ms, key=itemgetter("date"))
+
+        # (hour start, kWh); floor to the hour in integer ms, CET offsets are
+        # whole hours.  Starts are built in UTC, which needs no zone
+        # transition lookup per row; the recorder stores UTC anyway.
+        rows: list[tuple[datetime, float]] = [
+            (
+                datetime.fromtimestamp(v["date"] // 3_600_000 * 3600, tz=UTC),
+                v.get("value") or 0.0,
             )
-            dt_ts = dt.timestamp()
-
-            # Skip rows already covered by the recorder
-            if last_energy_ts is not None and dt_ts <= last_energy_ts:
-                continue
+            for v in sorted_values[first:]
+        ]
 
-            energy_sum = round(energy_sum + kwh, 3)
-            energy_stats.append(
-                StatisticData(start=dt, state=round(kwh, 3), sum=energy_sum)
-            )
+        energy_sums = accumulate((kwh for _, kwh in rows), initial=energy_sum)
+        next(energy_sums)
+        energy_stats = [
+            StatisticData(start=dt, state=round(kwh, 3), sum=round(total, 3))
+            for (dt, kwh), total in zip(rows, energy_sums)
+        ]
 
-            price = self.price_per_kwh_by_year.get(dt.year)
-            if price is not None:
-                cost = round(kwh * price, 4)
-                cost_sum = round(cost_sum + cost, 4)
-                cost_stats.append(
-                    StatisticData(start=dt, state=cost, sum=cost_sum)
-                )
+        # Tariffs apply per local calendar year: precompute each priced
+        # year's Europe/Zurich bounds once and bisect instead of localising
+        # every row.
+        years = sorted(prices)
+        year_starts = [datetime(y, 1, 1, tzinfo=CET).timestamp() for y in years]
+        year_ends = [datetime(y + 1, 1, 1, tzinfo=CET).timestamp() for y in years]
+        priced: list[tuple[datetime, float]] = []
+        for dt, kwh in rows:
+            ts = dt.timestamp()
+            i = bisect_right(year_starts, ts) - 1
+            if i >= 0 and ts < year_ends[i]:
+                priced.append((dt, round(kwh * prices[years[i]], 4)))
+
+        cost_sums = accumulate((cost for _, cost in priced), initial=cost_sum)
+        next(cost_sums)
+        cost_stats = [
+            StatisticData(start=dt, state=cost, sum=round(total, 4))
+            for (dt, cost), total in zip(priced, cost_sums)
+        ]
 
-        energy_metadata = StatisticMetaData(
-            has_mean=False,
-            mean_type=StatisticMeanType.NONE,
-            has_sum=True,
-            name="WWZ Energy Consumption",
-            source="wwz_energy",
-            statistic_id=self.energy_statistic_id,
-            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            unit_class="energy",
-        )
-        async_add_external_statistics(self.hass, energy_metadata, energy_stats)
+        async_add_external_statistics(self.hass, self._energy_metadata, energy_stats)
         _LOGGER.debug(
             "Inserted %d energy statistics for %s",
             len(energy_stats), self.energy_statistic_id,
         )
 
         if cost_stats:
-            cost_metadata = StatisticMetaData(
-                has_mean=False,
-                mean_type=StatisticMeanType.NONE,
-                has_sum=True,
-                name="WWZ Energy Cost",
-                source="wwz_energy",
-                statistic_id=self.cost_statistic_id,
-                unit_of_measurement="CHF",
-                unit_class=None,
-            )
-            async_add_external_statistics(self.hass, cost_metadata, cost_stats)
+            async_add_external_statistics(self.hass, self._cost_metadata, cost_stats)
             _LOGGER.debug(
                 "Inserted %d cost statistics for %s",
                 len(cost_stats), self.cost_statistic_id,
             )
+
+        for statistic_id, stats in (
+            (self.energy_statistic_id, energy_stats),
+            (self.cost_statistic_id, cost_stats),
+        ):
+            if stats:
+                self._sum_cache[statistic_id] = {
+                    s["start"].timestamp(): s["sum"] for s in stats[-SUM_CACHE_HOURS:]
+                }
+
+        self._last_stats_hash = stats_hash
+
+
+class WwzTariffCoordinator(DataUpdateCoordinator[dict[int, TariffData]]):
+    """Coordinator that caches WWZ tariff data per year."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="WWZ Tariff",
+            update_interval=TARIFF_UPDATE_INTERVAL,
+        )
+        self._cached: dict[int, TariffData] = {}
+
+    async def _async_update_data(self) -> dict[int, TariffData]:
+        current_year = datetime.now(tz=CET).year
+        years_needed = [current_year - 1, current_year]
+
+        async with aiohttp.ClientSession() as session:
+            for year in years_needed:
+                if year in self._cached:
+                    continue
+                try:
+                    self._cached[year] = await fetch_tariff_data(session, year)
+                except aiohttp.ClientResponseError as err:
+                    if err.status == 404:
+                        _LOGGER.debug("Tariff %d not available", year)
+                    else:
+                        raise UpdateFailed(
+                            f"Failed to fetch tariff data: {err}"
+                        ) from err
+                except aiohttp.ClientError as err:
+                    raise UpdateFailed(
+                        f"Connection error fetching tariffs: {err}"
+                    ) from err
+
+        return {y: t for y, t in self._cached.items() if y in years_needed}
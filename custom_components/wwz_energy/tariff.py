@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 
 import aiohttp
+import orjson
 
 from .const import TARIFF_URL_TEMPLATE
 
@@ -17,7 +18,6 @@ class TariffData:
     """Parsed WWZ tariff data for residential customers (NE 7)."""
 
     def __init__(self, raw: dict) -> None:
-        self._raw = raw
         self._tariffs = [
             t for t in raw.get("tariffs", [])
             if t.get("customerVoltageLevel") == RESIDENTIAL_VOLTAGE_LEVEL
@@ -128,5 +128,5 @@ async def fetch_tariff_data(
     _LOGGER.debug("Fetching tariff data from %s", url)
     async with session.get(url) as resp:
         resp.raise_for_status()
-        raw = await resp.json(content_type=None)
+        raw = await resp.json(loads=orjson.loads, content_type=None)
     return TariffData(raw)
@@ -2,11 +2,11 @@
 
 import re
 
+_SLUG_INVALID = re.compile(r"[^a-z0-9]")
+
 
 def statistic_ids_for_entry(unique_id: str) -> tuple[str, str]:
     """Return (energy_statistic_id, cost_statistic_id) for a config entry."""
-    slug = re.sub(r"[^a-z0-9]", "_", unique_id.lower()).strip("_")
-    return (
-        f"wwz_energy:{slug}_energy_consumption",
-        f"wwz_energy:{slug}_energy_cost",
-    )
+    slug = _SLUG_INVALID.sub("_", unique_id.lower()).strip("_")
+    prefix = f"wwz_energy:{slug}_energy_"
+    return (f"{prefix}consumption", f"{prefix}cost")
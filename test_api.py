@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import sys
-from datetime import datetime
 
 logging.basicConfig(level=logging.DEBUG)
 
@@ -15,6 +14,8 @@ from zoneinfo import ZoneInfo
 
 from wwz_energy.api import WwzApiClient
 
+CET = ZoneInfo("Europe/Zurich")
+
 
 async def main():
     username = input("Email: ")
@@ -33,16 +34,18 @@ async def main():
             return
 
         # Fetch yesterday's data (today may not have data yet)
-        yesterday = datetime.now(tz=ZoneInfo("Europe/Zurich")) - timedelta(days=1)
-        today = datetime.now(tz=ZoneInfo("Europe/Zurich")) - timedelta(days=0)
+        today = datetime.now(tz=CET)
+        yesterday = today - timedelta(days=1)
         
         data = await client.get_hourly_data(meter_id, from_date=yesterday, to_date=today)
         print(f"Unit: {data['unit']}")
         print(f"Hourly values ({len(data['values'])} entries):")
         
+        lines = []
         for v in data["values"]:
-            dt = datetime.fromtimestamp(v["date"] / 1000, tz=ZoneInfo("Europe/Zurich"))
-            print(f"  {dt.strftime('%Y-%m-%d %H:%M')} -> {v['value']} kWh (status: {v['status']})")
+            dt = datetime.fromtimestamp(v["date"] // 1000, tz=CET)
+            lines.append(f"  {dt:%Y-%m-%d %H:%M} -> {v['value']} kWh (status: {v['status']})\n")
+        sys.stdout.write("".join(lines))
 
     except Exception as e:
         print(f"\nERROR: {type(e).__name__}: {e}")
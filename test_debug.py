@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import sys
+from collections import defaultdict
 
 logging.basicConfig(level=logging.DEBUG)
 sys.path.insert(0, "custom_components")
@@ -28,14 +29,21 @@ async def main():
         now = datetime.now(tz=CET)
         yesterday = now - timedelta(days=1)
 
-        for label, from_date, to_date in [
-            ("Today", now, now),
-            ("Yesterday", yesterday, yesterday),
-        ]:
-            data = await client.get_hourly_data(meter_id, from_date=from_date, to_date=to_date)
+        # Independent requests, so fetch both days concurrently
+        results = await asyncio.gather(
+            client.get_hourly_data(meter_id, from_date=now, to_date=now),
+            client.get_hourly_data(meter_id, from_date=yesterday, to_date=yesterday),
+        )
+
+        for label, from_date, data in zip(
+            ("Today", "Yesterday"), (now, yesterday), results
+        ):
             values = data.get("values", [])
-            valid = [v for v in values if v["status"] == 0]
-            pending = [v for v in values if v["status"] == 3]
+            by_status: dict[int, list[dict]] = defaultdict(list)
+            for v in values:
+                by_status[v["status"]].append(v)
+            valid = by_status[0]
+            pending = by_status[3]
             print(f"\n{label} ({from_date.date()}):")
             print(f"  Total entries: {len(values)}")
             print(f"  Valid (status=0): {len(valid)}")